@@ -2,92 +2,114 @@
 Settings usage examples and utilities
 """
 
-from app.config.settings import settings
-from typing import Dict, Any, List
+from app.config.settings import settings, DatabaseDialect
+from typing import Dict, Any, Final, List
+
+# Settings are frozen once loaded, so every config below is built once at import
+CORS_CONFIG: Final[Dict[str, Any]] = {
+    "allow_origins": settings.allow_origins_list,
+    "allow_credentials": settings.allow_credentials,
+    "allow_methods": settings.allow_methods_list,
+    "allow_headers": settings.allow_headers_list,
+}
+
+DATABASE_CONFIG: Final[Dict[str, Any]] = {
+    "url": settings.database_url,
+    "echo": settings.database_echo,
+    "pool_size": settings.database_pool_size,
+    "max_overflow": settings.database_max_overflow,
+    "connect_args": {"check_same_thread": settings.database_check_same_thread} if settings.database_dialect == DatabaseDialect.SQLITE else {}
+}
+
+JWT_CONFIG: Final[Dict[str, Any]] = {
+    "secret_key": settings.jwt_secret_key or settings.secret_key,
+    "algorithm": settings.jwt_algorithm,
+    "access_token_expire_minutes": settings.jwt_access_token_expire_minutes,
+    "refresh_token_expire_days": settings.jwt_refresh_token_expire_days,
+}
+
+LOGGING_CONFIG: Final[Dict[str, Any]] = {
+    "level": settings.log_level,
+    "format": settings.log_format,
+    "rotation": settings.log_rotation,
+    "retention": settings.log_retention,
+    "compression": settings.log_compression,
+    "backtrace": settings.log_backtrace,
+    "colorize": settings.log_color,
+    "serialize": settings.log_json,
+}
+
+SERVER_CONFIG: Final[Dict[str, Any]] = {
+    "host": settings.host,
+    "port": settings.port,
+    "reload": settings.reload and settings.debug,
+    "debug": settings.debug,
+    "log_level": settings.log_level.lower(),
+}
+
+PRODUCTION_ENVIRONMENTS: Final = frozenset({"production"})
+DEVELOPMENT_ENVIRONMENTS: Final = frozenset({"development"})
+TESTING_ENVIRONMENTS: Final = frozenset({"testing"})
+
+_ENVIRONMENT = settings.environment.casefold()
+IS_PRODUCTION: Final[bool] = _ENVIRONMENT in PRODUCTION_ENVIRONMENTS
+IS_DEVELOPMENT: Final[bool] = _ENVIRONMENT in DEVELOPMENT_ENVIRONMENTS
+IS_TESTING: Final[bool] = _ENVIRONMENT in TESTING_ENVIRONMENTS
+
+APP_METADATA: Final[Dict[str, Any]] = {
+    "title": settings.app_name,
+    "description": settings.app_description,
+    "version": settings.app_version,
+    "contact": {
+        "name": settings.app_author,
+        "url": settings.app_contact,
+        "email": settings.app_contact_email,
+    } if settings.app_contact or settings.app_contact_email else None,
+    "license_info": {
+        "name": settings.app_license,
+    } if settings.app_license else None,
+}
 
 def get_cors_config() -> Dict[str, Any]:
     """Get CORS configuration for FastAPI"""
-    return {
-        "allow_origins": settings.get_allow_origins_list(),
-        "allow_credentials": settings.allow_credentials,
-        "allow_methods": settings.get_allow_methods_list(),
-        "allow_headers": settings.get_allow_headers_list(),
-    }
+    return CORS_CONFIG
 
 def get_trusted_hosts() -> List[str]:
     """Get trusted hosts for FastAPI"""
-    return settings.get_trusted_hosts_list()
+    return settings.trusted_hosts_list
 
 def get_database_config() -> Dict[str, Any]:
     """Get database configuration"""
-    return {
-        "url": settings.database_url,
-        "echo": settings.database_echo,
-        "pool_size": settings.database_pool_size,
-        "max_overflow": settings.database_max_overflow,
-        "connect_args": {"check_same_thread": settings.database_check_same_thread} if "sqlite" in settings.database_url else {}
-    }
+    return DATABASE_CONFIG
 
 def get_jwt_config() -> Dict[str, Any]:
     """Get JWT configuration"""
-    return {
-        "secret_key": settings.jwt_secret_key or settings.secret_key,
-        "algorithm": settings.jwt_algorithm,
-        "access_token_expire_minutes": settings.jwt_access_token_expire_minutes,
-        "refresh_token_expire_days": settings.jwt_refresh_token_expire_days,
-    }
+    return JWT_CONFIG
 
 def get_logging_config() -> Dict[str, Any]:
     """Get logging configuration for Loguru"""
-    return {
-        "level": settings.log_level,
-        "format": settings.log_format,
-        "rotation": settings.log_rotation,
-        "retention": settings.log_retention,
-        "compression": settings.log_compression,
-        "backtrace": settings.log_backtrace,
-        "colorize": settings.log_color,
-        "serialize": settings.log_json,
-    }
+    return LOGGING_CONFIG
 
 def get_server_config() -> Dict[str, Any]:
     """Get server configuration for Uvicorn"""
-    return {
-        "host": settings.host,
-        "port": settings.port,
-        "reload": settings.reload and settings.debug,
-        "debug": settings.debug,
-        "log_level": settings.log_level.lower(),
-    }
+    return SERVER_CONFIG
 
 def is_production() -> bool:
     """Check if running in production environment"""
-    return settings.environment.lower() == "production"
+    return IS_PRODUCTION
 
 def is_development() -> bool:
     """Check if running in development environment"""
-    return settings.environment.lower() == "development"
+    return IS_DEVELOPMENT
 
 def is_testing() -> bool:
     """Check if running in testing environment"""
-    return settings.environment.lower() == "testing"
+    return IS_TESTING
 
 # Example usage in FastAPI main.py
 def get_app_metadata() -> Dict[str, Any]:
     """Get application metadata for FastAPI"""
-    return {
-        "title": settings.app_name,
-        "description": settings.app_description,
-        "version": settings.app_version,
-        "contact": {
-            "name": settings.app_author,
-            "url": settings.app_contact,
-            "email": settings.app_contact_email,
-        } if settings.app_contact or settings.app_contact_email else None,
-        "license_info": {
-            "name": settings.app_license,
-        } if settings.app_license else None,
-    }
+    return APP_METADATA
 
 # Example usage functions
 if __name__ == "__main__":
@@ -120,9 +142,10 @@ if __name__ == "__main__":
     print(f"\n💾 Database Config:")
     db = get_database_config()
     for key, value in db.items():
-        if "url" in key.lower() and "sqlite" not in str(value).lower():
+        if key == "url" and settings.database_dialect != DatabaseDialect.SQLITE:
             # Mask database credentials for security
-            print(f"   {key}: {'***masked***' if '://' in str(value) else value}")
+            scheme, sep, _ = str(value).partition("://")
+            print(f"   {key}: {scheme + sep + '***masked***' if sep else value}")
         else:
             print(f"   {key}: {value}")
     
@@ -1,98 +1,155 @@
-from sqlalchemy import create_engine, event, text, Engine
+from sqlalchemy import create_engine, event, text, Engine, Connection
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool, QueuePool
+from sqlalchemy.pool import Pool, StaticPool, QueuePool
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError
+from starlette.exceptions import HTTPException
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Generator, Optional, Dict, Any, Type
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Final, Generator, Optional, Dict, Any, Type
 import logging
+import threading
 import time
-from .settings import settings
+from .settings import settings, DatabaseDialect
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+
+def _build_dialect_config() -> Dict[DatabaseDialect, Dict[str, Any]]:
+    """Build the engine configuration for every supported dialect."""
+    pooled = {
+        "pool_pre_ping": True,
+        "echo": settings.database_echo,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_recycle": 3600,  # Recycle connections every hour
+        "pool_timeout": 30,    # Timeout after 30 seconds
+    }
+    
+    return {
+        DatabaseDialect.SQLITE: {
+            "pool_pre_ping": True,
+            "echo": settings.database_echo,
+            "connect_args": {
+                "check_same_thread": settings.database_check_same_thread,
+                "timeout": 20,
+                "isolation_level": None,  # Autocommit mode
+            },
+            # SQLite doesn't benefit from multiple connections; StaticPool
+            # takes no sizing arguments
+            "poolclass": StaticPool,
+        },
+        DatabaseDialect.POSTGRES: {
+            **pooled,
+            "connect_args": {
+                "connect_timeout": 10,
+                "application_name": settings.app_name,
+            },
+            "poolclass": QueuePool,
+            "pool_reset_on_return": "commit",
+        },
+        DatabaseDialect.MYSQL: {
+            **pooled,
+            "connect_args": {
+                "connect_timeout": 10,
+                "charset": "utf8mb4",
+            },
+            "poolclass": QueuePool,
+            "pool_reset_on_return": "commit",
+        },
+        DatabaseDialect.OTHER: pooled,
+    }
+
+
+# Pragmas applied to every new SQLite connection in a single call
+SQLITE_PRAGMA_SCRIPT = (
+    "PRAGMA foreign_keys=ON;"
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"  # 256MB
+)
+
+# Engine configuration per dialect, built once at import
+DIALECT_CONFIG: Final[Dict[DatabaseDialect, Dict[str, Any]]] = _build_dialect_config()
+
+# The dialect is fixed per process, so resolve its configuration up front
+ENGINE_CONFIG: Final[Dict[str, Any]] = DIALECT_CONFIG[settings.database_dialect]
+
+_IS_SQLITE = settings.database_dialect == DatabaseDialect.SQLITE
+
+
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """Set SQLite pragmas for better performance and integrity."""
+    dbapi_connection.executescript(SQLITE_PRAGMA_SCRIPT)
+
+
+def _receive_engine_connect(conn):
+    """Log successful connections."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Database connection established")
+
+
+def _receive_handle_error(exception_context):
+    """Handle database errors and connection issues."""
+    logger.error("Database error: %s", exception_context.original_exception)
+    
+    if isinstance(exception_context.original_exception, DisconnectionError):
+        logger.warning("Database disconnection detected, connection will be refreshed")
+
+
 class DatabaseManager:
     """Enhanced database manager with connection pooling, health checks, and error handling."""
     
     def __init__(self):
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
+        self._new_session: Optional[Callable[[], Session]] = None
         self._base: Optional[Type[DeclarativeMeta]] = None
         self._is_initialized = False
         self._connection_retry_attempts = 3
         self._connection_retry_delay = 1.0
+        self._connection_retry_max_delay = 5.0
+        self._masked_url = settings.parsed_database_url.drivername + "://***"
+        self._pool_type_name: Optional[str] = None
+        self._pool_stats_fn: Callable[[], Dict[str, Any]] = dict
     
-    @property
-    def engine(self) -> Engine:
-        """Get the database engine, initializing if necessary."""
-        if not self._is_initialized:
-            self._initialize()
-        if self._engine is None:
-            raise RuntimeError("Database engine not initialized")
-        return self._engine
+    # engine, session_factory and base are bound as plain instance attributes
+    # once initialization succeeds; until then, __getattr__ initializes lazily.
+    _LAZY_ATTRIBUTES = {
+        "engine": "_engine",
+        "session_factory": "_session_factory",
+        "base": "_base",
+    }
     
-    @property
-    def session_factory(self) -> sessionmaker:
-        """Get the session factory, initializing if necessary."""
-        if not self._is_initialized:
-            self._initialize()
-        if self._session_factory is None:
-            raise RuntimeError("Session factory not initialized")
-        return self._session_factory
+    engine: Engine
+    session_factory: sessionmaker
+    base: Type[DeclarativeMeta]
     
-    @property
-    def base(self) -> Type[DeclarativeMeta]:
-        """Get the declarative base, initializing if necessary."""
-        if not self._is_initialized:
-            self._initialize()
-        if self._base is None:
-            raise RuntimeError("Declarative base not initialized")
-        return self._base
+    def __getattr__(self, name: str) -> Any:
+        """Initialize on first access to engine, session_factory or base."""
+        private_name = DatabaseManager._LAZY_ATTRIBUTES.get(name)
+        if private_name is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self._initialize()
+        value = self.__dict__.get(private_name)
+        if value is None:
+            raise RuntimeError(f"Database {name} not initialized")
+        return value
+    
+    def _bind_initialized(self):
+        """Replace the lazy accessors with direct attributes after init."""
+        self.engine = self._engine
+        self.session_factory = self._session_factory
+        self.base = self._base
+        # Calling the session constructor directly skips the init check entirely
+        self.get_session = self._new_session
     
     def _get_engine_config(self) -> Dict[str, Any]:
         """Get engine configuration based on database type."""
-        config = {
-            "pool_pre_ping": True,
-            "echo": settings.database_echo,
-            "pool_size": settings.database_pool_size,
-            "max_overflow": settings.database_max_overflow,
-            "pool_recycle": 3600,  # Recycle connections every hour
-            "pool_timeout": 30,    # Timeout after 30 seconds
-        }
-        
-        # Database-specific configurations
-        if "sqlite" in settings.database_url.lower():
-            config.update({
-                "connect_args": {
-                    "check_same_thread": settings.database_check_same_thread,
-                    "timeout": 20,
-                    "isolation_level": None,  # Autocommit mode
-                },
-                "poolclass": StaticPool,
-                "pool_size": 1,  # SQLite doesn't benefit from multiple connections
-                "max_overflow": 0,
-            })
-        elif "postgresql" in settings.database_url.lower():
-            config.update({
-                "connect_args": {
-                    "connect_timeout": 10,
-                    "application_name": settings.app_name,
-                },
-                "poolclass": QueuePool,
-                "pool_reset_on_return": "commit",
-            })
-        elif "mysql" in settings.database_url.lower():
-            config.update({
-                "connect_args": {
-                    "connect_timeout": 10,
-                    "charset": "utf8mb4",
-                },
-                "poolclass": QueuePool,
-                "pool_reset_on_return": "commit",
-            })
-        
-        return config
+        return ENGINE_CONFIG
     
     def _initialize(self):
         """Initialize the database engine and session factory."""
@@ -104,62 +161,67 @@ class DatabaseManager:
             
             # Create engine with appropriate configuration
             engine_config = self._get_engine_config()
-            self._engine = create_engine(settings.database_url, **engine_config)
+            self._engine = create_engine(settings.parsed_database_url, **engine_config)
+            
+            self._pool_type_name = type(self._engine.pool).__name__
+            self._pool_stats_fn = self._build_pool_stats_fn(self._engine.pool)
             
             # Add event listeners
             self._add_event_listeners()
             
             # Create session factory
-            self._session_factory = sessionmaker(
-                bind=self._engine,
-                autocommit=False,
-                autoflush=False,
-                expire_on_commit=False,  # Keep objects usable after commit
-            )
+            session_kwargs = {
+                "bind": self._engine,
+                "autoflush": False,
+                "expire_on_commit": False,  # Keep objects usable after commit
+            }
+            self._session_factory = sessionmaker(autocommit=False, **session_kwargs)
+            # get_session builds the session directly, skipping
+            # sessionmaker.__call__; reading the factory's class and kwargs
+            # keeps both paths configured identically
+            self._new_session = partial(self._session_factory.class_, **self._session_factory.kw)
             
             # Create declarative base
             self._base = declarative_base()
             
-            # Test the connection
-            self._test_connection()
+            # Test the connection; pool_pre_ping already validates every
+            # checkout, so this is only an opt-in fail-fast probe
+            if settings.database_startup_probe_enabled:
+                self._test_connection()
             
             self._is_initialized = True
+            self._bind_initialized()
             logger.info("Database initialization completed successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             self._cleanup()
             raise
     
+    @staticmethod
+    def _build_pool_stats_fn(pool: Pool) -> Callable[[], Dict[str, Any]]:
+        """Pick the pool statistics reader once, based on the pool class."""
+        if isinstance(pool, QueuePool):
+            return lambda: {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        # StaticPool and other pools expose no sizing statistics
+        return dict
+    
     def _add_event_listeners(self):
         """Add SQLAlchemy event listeners for connection management."""
         if self._engine is None:
             return
-            
-        @event.listens_for(self._engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set SQLite pragmas for better performance and integrity."""
-            if "sqlite" in settings.database_url.lower():
-                cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.execute("PRAGMA journal_mode=WAL")
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                cursor.execute("PRAGMA temp_store=MEMORY")
-                cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
-                cursor.close()
         
-        @event.listens_for(self._engine, "engine_connect")
-        def receive_engine_connect(conn, branch):
-            """Log successful connections."""
-            logger.debug("Database connection established")
-        
-        @event.listens_for(self._engine, "handle_error")
-        def receive_handle_error(exception_context):
-            """Handle database errors and connection issues."""
-            logger.error(f"Database error: {exception_context.original_exception}")
-            
-            if isinstance(exception_context.original_exception, DisconnectionError):
-                logger.warning("Database disconnection detected, connection will be refreshed")
+        # The dialect is fixed per process, so only register the pragma
+        # listener when it will actually do something
+        if _IS_SQLITE:
+            event.listen(self._engine, "connect", _set_sqlite_pragma)
+        event.listen(self._engine, "engine_connect", _receive_engine_connect)
+        event.listen(self._engine, "handle_error", _receive_handle_error)
     
     def _test_connection(self):
         """Test the database connection."""
@@ -175,19 +237,70 @@ class DatabaseManager:
                 return
             except Exception as e:
                 if attempt < max_retries - 1:
-                    logger.warning(f"Connection test attempt {attempt + 1} failed: {e}")
-                    time.sleep(self._connection_retry_delay)
+                    logger.warning("Connection test attempt %s failed: %s", attempt + 1, e)
+                    time.sleep(min(self._connection_retry_delay * 2 ** attempt, self._connection_retry_max_delay))
                 else:
-                    logger.error(f"All connection test attempts failed: {e}")
+                    logger.error("All connection test attempts failed: %s", e)
                     raise
     
+    def warmup(self, n: Optional[int] = None) -> int:
+        """Pre-open pool connections so early requests don't pay the connect cost."""
+        if n is None:
+            n = settings.database_pool_size
+        if settings.database_dialect == DatabaseDialect.SQLITE:
+            n = min(n, 1)  # StaticPool only ever holds a single connection
+        if n < 1:
+            # Nothing to pre-open (warmup(0) or DATABASE_POOL_SIZE=0)
+            return 0
+        
+        engine = self.engine
+        barrier = threading.Barrier(n, timeout=30)
+        connections = []
+        
+        # Open connections concurrently and hold every one until all are open,
+        # so each goes back to the pool as a distinct checked-in connection
+        with ThreadPoolExecutor(max_workers=n, thread_name_prefix="db-warmup") as executor:
+            futures = [executor.submit(self._open_and_hold, engine, barrier) for _ in range(n)]
+            for future in futures:
+                try:
+                    connections.append(future.result())
+                except Exception as e:
+                    logger.warning("Database pool warmup connection failed: %s", e)
+        
+        for conn in connections:
+            conn.close()
+        
+        logger.info("Database pool warmed up with %s connections", len(connections))
+        return len(connections)
+    
+    @staticmethod
+    def _open_and_hold(engine: Engine, barrier: threading.Barrier) -> Connection:
+        """Open a connection and wait until the rest of the warmup batch is open."""
+        try:
+            conn = engine.connect()
+        except Exception:
+            barrier.abort()
+            raise
+        
+        try:
+            conn.execute(text("SELECT 1"))
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            # Another connection failed; keep this one, it is still valid
+            pass
+        except Exception:
+            barrier.abort()
+            conn.close()
+            raise
+        return conn
+    
     def get_session(self) -> Session:
         """Get a new database session."""
         if not self._is_initialized:
             self._initialize()
-        if self._session_factory is None:
+        if self._new_session is None:
             raise RuntimeError("Session factory not initialized")
-        return self._session_factory()
+        return self._new_session()
     
     @contextmanager
     def get_session_context(self) -> Generator[Session, None, None]:
@@ -198,7 +311,7 @@ class DatabaseManager:
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"Database session error: {e}")
+            logger.error("Database session error: %s", e)
             raise
         finally:
             session.close()
@@ -206,84 +319,51 @@ class DatabaseManager:
     def health_check(self) -> Dict[str, Any]:
         """Perform a health check on the database connection."""
         try:
-            if self._engine is None:
-                return {
-                    "status": "unhealthy",
-                    "error": "Database engine not initialized",
-                    "database_url": settings.database_url.split("://")[0] + "://***",
-                }
+            # Touching engine initializes the database on first use
+            engine = self.engine
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
-            with self._engine.connect() as conn:
+            with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             
-            # Get basic connection pool info
-            pool_info = {}
-            try:
-                pool = self._engine.pool
-                pool_info["pool_type"] = type(pool).__name__
-                
-                # Try to get pool statistics safely
-                try:
-                    # Some pools have these as properties, others as methods
-                    for attr in ['size', 'checked_in', 'checked_out', 'overflow']:
-                        if hasattr(pool, attr):
-                            value = getattr(pool, attr)
-                            # If it's callable, call it
-                            if callable(value):
-                                try:
-                                    pool_info[attr] = value()
-                                except:
-                                    pass
-                            else:
-                                pool_info[attr] = value
-                except Exception:
-                    pass
-                        
-            except Exception as pool_error:
-                logger.debug(f"Could not get pool info: {pool_error}")
-                pool_info = {"error": "Pool info not available"}
+            pool_info = {"pool_type": self._pool_type_name, **self._pool_stats_fn()}
             
             return {
                 "status": "healthy",
                 "response_time_ms": round(response_time * 1000, 2),
                 "pool_status": pool_info,
-                "database_url": settings.database_url.split("://")[0] + "://***",  # Hide credentials
+                "database_url": self._masked_url,  # Hide credentials
             }
             
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "database_url": settings.database_url.split("://")[0] + "://***",
+                "database_url": self._masked_url,
             }
     
     def create_tables(self):
         """Create all database tables."""
         try:
             logger.info("Creating database tables...")
-            if self._base is None:
-                raise RuntimeError("Declarative base not initialized")
-            self._base.metadata.create_all(bind=self.engine)
+            self.base.metadata.create_all(bind=self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
-            logger.error(f"Failed to create tables: {e}")
+            logger.error("Failed to create tables: %s", e)
             raise
     
     def drop_tables(self):
         """Drop all database tables."""
         try:
             logger.info("Dropping database tables...")
-            if self._base is None:
-                raise RuntimeError("Declarative base not initialized")
-            self._base.metadata.drop_all(bind=self.engine)
+            self.base.metadata.drop_all(bind=self.engine)
             logger.info("Database tables dropped successfully")
         except Exception as e:
-            logger.error(f"Failed to drop tables: {e}")
+            logger.error("Failed to drop tables: %s", e)
             raise
     
     def _cleanup(self):
@@ -293,12 +373,17 @@ class DatabaseManager:
                 self._engine.dispose()
                 logger.info("Database engine disposed")
             except Exception as e:
-                logger.error(f"Error disposing engine: {e}")
+                logger.error("Error disposing engine: %s", e)
         
         self._engine = None
         self._session_factory = None
+        self._new_session = None
         self._base = None
+        self._pool_type_name = None
+        self._pool_stats_fn = dict
         self._is_initialized = False
+        for name in ("engine", "session_factory", "base", "get_session"):
+            self.__dict__.pop(name, None)
     
     def close(self):
         """Close all database connections and cleanup resources."""
@@ -309,27 +394,47 @@ class DatabaseManager:
 # Global database manager instance
 db_manager = DatabaseManager()
 
-# Backward compatibility - expose traditional objects
-engine = db_manager.engine
-SessionLocal = db_manager.session_factory
-Base = db_manager.base
+# Backward compatibility - expose traditional objects lazily (PEP 562) so
+# importing this module doesn't connect to the database
+_LEGACY_ATTRIBUTES = {
+    "engine": "engine",
+    "SessionLocal": "session_factory",
+    "Base": "base",
+}
+
+if TYPE_CHECKING:
+    engine: Engine
+    SessionLocal: sessionmaker
+    Base: Type[DeclarativeMeta]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LEGACY_ATTRIBUTES:
+        return getattr(db_manager, _LEGACY_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
     Used with FastAPI's Depends() for automatic session management.
+    FastAPI caches dependencies per request, so every Depends(get_db) in
+    one request's dependency graph already shares a single session.
     """
     session = db_manager.get_session()
     try:
         yield session
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"Database error in get_db: {e}")
+        logger.error("Database error in get_db: %s", e)
+        raise
+    except HTTPException:
+        # Expected client errors (e.g. a duplicate email) are not failures
+        session.rollback()
         raise
     except Exception as e:
         session.rollback()
-        logger.error(f"Unexpected error in get_db: {e}")
+        logger.error("Unexpected error in get_db: %s", e)
         raise
     finally:
         session.close()
@@ -346,10 +451,15 @@ def init_db():
         db_manager.create_tables()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e)
         raise
 
 
+def warmup_db(n: Optional[int] = None) -> int:
+    """Pre-open database pool connections."""
+    return db_manager.warmup(n)
+
+
 def close_db():
     """Close database connections."""
     db_manager.close()
@@ -1,9 +1,30 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from typing import List, Optional, Any
-import os
-from pathlib import Path
-from pathlib import Path
+from sqlalchemy.engine.url import URL, make_url
+from typing import TYPE_CHECKING, List, Optional, Any
+from functools import cached_property, lru_cache
+from enum import IntEnum
+
+
+def _split_csv(value: Any) -> List[str]:
+    """Split a comma-separated setting into a list of stripped, non-empty items"""
+    if isinstance(value, str):
+        return [item for item in map(str.strip, value.split(',')) if item]
+    return value if isinstance(value, list) else [value]
+
+class DatabaseDialect(IntEnum):
+    """Database backends with dialect-specific engine configuration."""
+    SQLITE = 0
+    POSTGRES = 1
+    MYSQL = 2
+    OTHER = 3
+
+_DIALECT_PREFIXES = {
+    "sqlite": DatabaseDialect.SQLITE,
+    "postgresql": DatabaseDialect.POSTGRES,
+    "postgres": DatabaseDialect.POSTGRES,
+    "mysql": DatabaseDialect.MYSQL,
+}
 
 class Settings(BaseSettings):
     """Configuration settings for the application."""
@@ -52,6 +73,12 @@ class Settings(BaseSettings):
     database_pool_size: int = Field(default=5, description="Database connection pool size")
     database_max_overflow: int = Field(default=10, description="Database max overflow connections")
     database_check_same_thread: bool = Field(default=False, description="SQLite check same thread")
+    database_warmup_enabled: bool = Field(default=True, description="Pre-open pool connections at startup")
+    database_startup_probe_enabled: Optional[bool] = Field(default=None, validate_default=True, description="Test the database connection at startup (defaults to on in production)")
+    
+    # User Lookup Cache
+    user_cache_ttl_seconds: float = Field(default=30, description="Seconds a cached user lookup stays valid (0 disables the cache)")
+    user_cache_max_size: int = Field(default=10_000, description="Maximum number of cached user lookups")
     
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
@@ -107,6 +134,7 @@ class Settings(BaseSettings):
     password_require_lowercase: bool = Field(default=True, description="Require lowercase in password")
     password_require_numbers: bool = Field(default=True, description="Require numbers in password")
     password_require_special_chars: bool = Field(default=True, description="Require special characters in password")
+    password_bcrypt_rounds: int = Field(default=12, ge=4, le=31, description="bcrypt cost factor (log2 rounds) for password hashes")
     
     # Monitoring
     sentry_dsn: Optional[str] = Field(default=None, description="Sentry DSN for error tracking")
@@ -121,6 +149,14 @@ class Settings(BaseSettings):
             return info.data.get('secret_key', 'default-secret-key')
         return v or 'default-secret-key'
     
+    @field_validator('database_startup_probe_enabled', mode='before')
+    @classmethod
+    def set_database_startup_probe_enabled(cls, v: Any, info) -> bool:
+        """Enable the startup probe by default only in production"""
+        if v is None:
+            return str(info.data.get('environment', '')).casefold() == 'production'
+        return v
+    
     @field_validator('smtp_from_name', mode='before')
     @classmethod
     def set_smtp_from_name(cls, v: Any, info) -> str:
@@ -129,35 +165,72 @@ class Settings(BaseSettings):
             return info.data.get('app_name', 'Auth Service')
         return v or 'Auth Service'
     
+    @cached_property
+    def allow_origins_list(self) -> List[str]:
+        """allow_origins parsed once into a list"""
+        return _split_csv(self.allow_origins)
+    
+    @cached_property
+    def allow_methods_list(self) -> List[str]:
+        """allow_methods parsed once into a list"""
+        return _split_csv(self.allow_methods)
+    
+    @cached_property
+    def allow_headers_list(self) -> List[str]:
+        """allow_headers parsed once into a list"""
+        return _split_csv(self.allow_headers)
+    
+    @cached_property
+    def trusted_hosts_list(self) -> List[str]:
+        """trusted_hosts parsed once into a list"""
+        return _split_csv(self.trusted_hosts)
+    
+    @cached_property
+    def parsed_database_url(self) -> URL:
+        """database_url parsed once into a SQLAlchemy URL"""
+        return make_url(self.database_url)
+    
+    @cached_property
+    def database_dialect(self) -> DatabaseDialect:
+        """Dialect of database_url, resolved once from the parsed URL"""
+        return _DIALECT_PREFIXES.get(self.parsed_database_url.get_backend_name(), DatabaseDialect.OTHER)
+    
     def get_allow_origins_list(self) -> List[str]:
         """Get allow_origins as a list"""
-        if isinstance(self.allow_origins, str):
-            return [origin.strip() for origin in self.allow_origins.split(',') if origin.strip()]
-        return self.allow_origins if isinstance(self.allow_origins, list) else [self.allow_origins]
+        return self.allow_origins_list
     
     def get_allow_methods_list(self) -> List[str]:
         """Get allow_methods as a list"""
-        if isinstance(self.allow_methods, str):
-            return [method.strip() for method in self.allow_methods.split(',') if method.strip()]
-        return self.allow_methods if isinstance(self.allow_methods, list) else [self.allow_methods]
+        return self.allow_methods_list
     
     def get_allow_headers_list(self) -> List[str]:
         """Get allow_headers as a list"""
-        if isinstance(self.allow_headers, str):
-            return [header.strip() for header in self.allow_headers.split(',') if header.strip()]
-        return self.allow_headers if isinstance(self.allow_headers, list) else [self.allow_headers]
+        return self.allow_headers_list
     
     def get_trusted_hosts_list(self) -> List[str]:
         """Get trusted_hosts as a list"""
-        if isinstance(self.trusted_hosts, str):
-            return [host.strip() for host in self.trusted_hosts.split(',') if host.strip()]
-        return self.trusted_hosts if isinstance(self.trusted_hosts, list) else [self.trusted_hosts]
+        return self.trusted_hosts_list
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
         extra = "ignore"
+        # Settings are a read-only snapshot once loaded, which keeps the
+        # cached derived values above consistent with the raw fields
+        frozen = True
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once, reading .env on first use only"""
+    return Settings()
+
+def __getattr__(name: str) -> Any:
+    # Resolve `settings` through the cached loader (PEP 562); call
+    # get_settings.cache_clear() to force the next lookup to re-read .env
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Create settings instance
-settings = Settings()
\ No newline at end of file
+if TYPE_CHECKING:
+    settings: Settings
\ No newline at end of file
@@ -1,24 +1,26 @@
 from app.services.UserService import user_service
-from app.schemas.users import UserCreate, UserResponse
-from app.config.database import logger
+from app.schemas.user import UserCreate, UserResponse
+from loguru import logger
 from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from typing import Optional
 
 class UserController:    
     def __init__(self):
         self.user_service = user_service
     
-    async def create_user(self, user_data: UserCreate) -> UserResponse:
+    def create_user(self, user_data: UserCreate, session: Optional[Session] = None) -> UserResponse:
         try:
-            return self.user_service.create_user(user_data)
+            return self.user_service.create_user(user_data, session=session)
             
         except ValueError as e:
-            logger.warning(f"User creation validation error: {str(e)}")
+            logger.warning("User creation validation error: {}", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
         except Exception as e:
-            logger.error(f"Unexpected error during user creation: {str(e)}")
+            logger.error("Unexpected error during user creation: {}", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create user"
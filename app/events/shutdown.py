@@ -1,8 +1,11 @@
+import asyncio
 from loguru import logger
 from app.config.settings import settings
 from app.config.database import close_db
 from app.utils.pycache_cleanup import cleanup_pycache
 
+_DEV_ENVIRONMENTS = frozenset({"development", "dev"})
+
 async def shutdown_event():
     """
     Shutdown event handler for the FastAPI application.
@@ -12,16 +15,19 @@ async def shutdown_event():
     logger.info("Performing cleanup operations...")
     
     logger.info("Closing database connections...")
-    close_db()
+    tasks = [asyncio.to_thread(close_db)]
     
     logger.info("Cleaning up temporary files and caches...")
     
     # Clean up __pycache__ folders only in development mode
-    if settings.environment.lower() in ['development', 'dev'] or settings.debug:
-        await cleanup_pycache()
+    if settings.debug or settings.environment.lower() in _DEV_ENVIRONMENTS:
+        tasks.append(cleanup_pycache())
     else:
         logger.info("Skipping __pycache__ cleanup (not in development mode)")
     
+    # Closing the database and cleaning caches are independent, so overlap them
+    await asyncio.gather(*tasks)
+    
     logger.info("Cleanup operations completed")
     logger.warning("Application shutdown completed")
 
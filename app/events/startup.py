@@ -1,5 +1,7 @@
+import asyncio
 from loguru import logger
-from app.config.database import db_health_check, init_db
+from app.config.database import db_health_check, init_db, warmup_db
+from app.config.settings import settings
 
 async def startup_event():
     """
@@ -12,6 +14,10 @@ async def startup_event():
     logger.info("Connecting to the database...")
     try:
         init_db()
+        if settings.database_warmup_enabled:
+            # Warmup blocks on connects (up to the barrier timeout), so keep
+            # it off the event loop
+            await asyncio.to_thread(warmup_db)
         health = db_health_check()
         logger.info(f"Database health status: {health}")
         logger.info("Database connection established successfully")
@@ -1,7 +1,8 @@
 # app/models/user.py
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Enum as SQLEnum
+from sqlalchemy import DDL, Column, Index, Integer, String, Boolean, DateTime, Text, Enum as SQLEnum, event, text
 from sqlalchemy.sql import func
 from datetime import datetime
+from operator import attrgetter
 from enum import Enum
 from app.config.database import Base
 import uuid
@@ -24,8 +25,55 @@ class UserStatus(str, Enum):
     SUSPENDED = "suspended"
     PENDING_VERIFICATION = "pending_verification"
 
+
+# Public fields shared by to_dict and to_response, fetched in one attrgetter call
+_USER_FIELDS = (
+    "id",
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "full_name",
+    "display_name",
+    "avatar_url",
+    "phone_number",
+    "date_of_birth",
+    "gender",
+    "timezone",
+    "locale",
+    "status",
+    "created_at",
+    "updated_at",
+)
+_USER_GETTER = attrgetter(*_USER_FIELDS)
+
+# Columns matched by UserRepository.search_users
+_SEARCH_COLUMNS = ("first_name", "last_name", "email", "username")
+
 class User(Base):    
     __tablename__ = "users"
+    __table_args__ = (
+        # email and username are already unique-indexed; this narrower index
+        # serves lookups restricted to active accounts. SQLEnum stores the
+        # member name, so the predicate compares against UserStatus.ACTIVE.name
+        Index(
+            "ix_users_active_email",
+            "email",
+            postgresql_where=text(f"status = '{UserStatus.ACTIVE.name}'"),
+            sqlite_where=text(f"status = '{UserStatus.ACTIVE.name}'"),
+        ),
+        # Trigram GIN indexes let PostgreSQL answer search_users' ILIKE '%term%'
+        # filters without a sequential scan; other dialects skip them
+        *(
+            Index(
+                f"ix_users_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in _SEARCH_COLUMNS
+        ),
+    )
     
     id = Column(
         String(36), 
@@ -135,24 +183,13 @@ class User(Base):
         return f"{self.first_name} {self.last_name}".strip()
     
     def to_dict(self, include_sensitive: bool = False) -> dict:
-        user_dict = {
-            "id": self.id,
-            "email": self.email,
-            "username": self.username,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "full_name": self.full_name,
-            "display_name": self.display_name,
-            "avatar_url": self.avatar_url,
-            "phone_number": self.phone_number,
-            "date_of_birth": self.date_of_birth.isoformat() if self.date_of_birth is not None else None,
-            "gender": self.gender.value if self.gender is not None else None,
-            "timezone": self.timezone,
-            "locale": self.locale,
-            "status": self.status.value if self.status is not None else None,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        user_dict = dict(zip(_USER_FIELDS, _USER_GETTER(self)))
+        # Reuse the values already fetched; None passes through unchanged
+        date_of_birth, gender, status = user_dict["date_of_birth"], user_dict["gender"], user_dict["status"]
+        user_dict["date_of_birth"] = date_of_birth and date_of_birth.isoformat()
+        user_dict["gender"] = gender and gender.value
+        # status is NOT NULL once persisted, but still None on an unflushed instance
+        user_dict["status"] = status and status.value
         
         if include_sensitive:
             user_dict["password"] = self.password
@@ -161,21 +198,12 @@ class User(Base):
         return user_dict
     
     def to_response(self) -> dict:
-        return {
-            "id": self.id,
-            "email": self.email,
-            "username": self.username,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "full_name": f"{self.first_name} {self.last_name}".strip(),
-            "display_name": self.display_name,
-            "avatar_url": self.avatar_url,
-            "phone_number": self.phone_number,
-            "date_of_birth": self.date_of_birth,
-            "gender": self.gender,
-            "timezone": self.timezone,
-            "locale": self.locale,
-            "status": self.status,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at
-        }
\ No newline at end of file
+        return dict(zip(_USER_FIELDS, _USER_GETTER(self)))
+
+
+# pg_trgm must exist before the trigram indexes above are created
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -1,25 +1,115 @@
 # app/repositories/base_repository.py
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from contextlib import contextmanager
+from typing import Generator, Generic, Iterator, TypeVar, List, Optional, Dict, Any
+from sqlalchemy.orm import Query, Session, load_only
 from sqlalchemy.ext.declarative import DeclarativeMeta
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy import Select, and_, or_, desc, asc, bindparam, func, insert, inspect, select, update
 from app.config.database import get_db_context
 from app.models.user import User
 
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 
+# Upper bound on values per IN (...) list, keeping statements small to parse
+IN_CHUNK_SIZE = 1000
+
+# Rows fetched per round trip by iter_all
+STREAM_BATCH_SIZE = 500
+
+# IN lists up to this length are ranked ahead of longer ones in filter ordering
+SHORT_IN_LIST_SIZE = 10
+
 
 class BaseRepository(Generic[ModelType], ABC):
     """Base repository class with common CRUD operations."""
     
     def __init__(self, model: type[ModelType]):
         self.model = model
+        # Column attributes by name, resolved once instead of via hasattr/getattr per call
+        self._columns: Dict[str, Any] = {
+            attr.key: getattr(model, attr.key) for attr in inspect(model).column_attrs
+        }
+        # Columns an equality filter is expected to narrow quickly (see _filter_rank)
+        table = model.__table__
+        self._selective_columns = frozenset(
+            {column.key for index in table.indexes for column in index.columns}
+            | {column.key for column in table.columns if column.primary_key or column.unique}
+        )
+        # Single-row lookup statements by column name, built on first use
+        self._lookup_statements: Dict[str, Select] = {}
+    
+    @contextmanager
+    def _session_scope(self, session: Optional[Session] = None) -> Generator[Session, None, None]:
+        """Use the caller's session if given, otherwise a short-lived one.
+        
+        Writes still commit, so a shared session sees each write as its own unit.
+        """
+        if session is not None:
+            yield session
+        else:
+            with get_db_context() as own_session:
+                yield own_session
+    
+    def _project(self, query: Query, columns: Optional[List[str]]) -> Query:
+        """Load only the given columns (plus the primary key) when columns is set."""
+        if columns:
+            return query.options(load_only(*(self._columns[column] for column in columns)))
+        return query
     
-    def get_by_id(self, id: Any) -> Optional[ModelType]:
+    def _filter_rank(self, field: str, value: Any) -> int:
+        """Rank a filter by expected selectivity, most selective first.
+        
+        0: equality on an indexed column, 1: other equality,
+        2: short IN list, 3: long IN list.
+        """
+        if isinstance(value, list):
+            return 2 if len(value) <= SHORT_IN_LIST_SIZE else 3
+        return 0 if field in self._selective_columns else 1
+    
+    def _apply_filters(self, query: Query, filters: Optional[Dict[str, Any]]) -> Query:
+        """Apply equality / IN filters, most selective predicates first.
+        
+        Fields that are not attributes of the model are ignored.
+        """
+        if not filters:
+            return query
+        known = [(field, value) for field, value in filters.items() if field in self._columns]
+        known.sort(key=lambda item: self._filter_rank(*item))
+        for field, value in known:
+            column = self._columns[field]
+            if isinstance(value, list):
+                query = query.filter(column.in_(value))
+            else:
+                query = query.filter(column == value)
+        return query
+    
+    def _apply_ordering(self, query: Query, order_by: Optional[str], order_desc: bool) -> Query:
+        """Order by the given column, ignoring names that are not columns."""
+        order_column = self._columns.get(order_by) if order_by else None
+        if order_column is None:
+            return query
+        return query.order_by(desc(order_column) if order_desc else asc(order_column))
+    
+    def _lookup_statement(self, field_name: str) -> Select:
+        """SELECT ... WHERE <field> = :value LIMIT 1, reused across calls.
+        
+        Reusing the same statement object lets SQLAlchemy's compiled cache
+        skip rebuilding and compiling the query on every lookup.
+        """
+        statement = self._lookup_statements.get(field_name)
+        if statement is None:
+            statement = (
+                select(self.model)
+                .where(self._columns[field_name] == bindparam("value"))
+                .limit(1)
+            )
+            self._lookup_statements[field_name] = statement
+        return statement
+    
+    def get_by_id(self, id: Any, session: Optional[Session] = None) -> Optional[ModelType]:
         """Get a single record by ID."""
-        with get_db_context() as session:
-            return session.query(self.model).filter(getattr(self.model, "id") == id).first()
+        with self._session_scope(session) as session:
+            return session.scalars(self._lookup_statement("id"), {"value": id}).first()
     
     def get_all(
         self, 
@@ -27,58 +117,61 @@ class BaseRepository(Generic[ModelType], ABC):
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
-        order_desc: bool = False
+        order_desc: bool = False,
+        columns: Optional[List[str]] = None,
+        session: Optional[Session] = None
     ) -> List[ModelType]:
-        """Get all records with optional filtering and pagination."""
-        with get_db_context() as session:
-            query = session.query(self.model)
-            
-            # Apply filters
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model, field):
-                        if isinstance(value, list):
-                            query = query.filter(getattr(self.model, field).in_(value))
-                        else:
-                            query = query.filter(getattr(self.model, field) == value)
-            
-            # Apply ordering
-            if order_by and hasattr(self.model, order_by):
-                if order_desc:
-                    query = query.order_by(desc(getattr(self.model, order_by)))
-                else:
-                    query = query.order_by(asc(getattr(self.model, order_by)))
-            
+        """Get all records with optional filtering and pagination.
+        
+        Pass columns to fetch only those attributes; the rest are deferred.
+        """
+        with self._session_scope(session) as session:
+            query = self._project(session.query(self.model), columns)
+            query = self._apply_filters(query, filters)
+            query = self._apply_ordering(query, order_by, order_desc)
             return query.offset(skip).limit(limit).all()
     
-    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+    def iter_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        order_desc: bool = False,
+        columns: Optional[List[str]] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        session: Optional[Session] = None
+    ) -> Iterator[ModelType]:
+        """Iterate over all matching records, fetching batch_size rows at a time.
+        
+        Unlike get_all, rows are streamed (a server-side cursor where the
+        driver supports one) so memory stays flat for large listings. The
+        session stays open until the iterator is exhausted or closed.
+        """
+        with self._session_scope(session) as session:
+            query = self._project(session.query(self.model), columns)
+            query = self._apply_filters(query, filters)
+            query = self._apply_ordering(query, order_by, order_desc)
+            yield from query.yield_per(batch_size)
+    
+    def count(self, filters: Optional[Dict[str, Any]] = None, session: Optional[Session] = None) -> int:
         """Count records with optional filtering."""
-        with get_db_context() as session:
-            query = session.query(self.model)
-            
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model, field):
-                        if isinstance(value, list):
-                            query = query.filter(getattr(self.model, field).in_(value))
-                        else:
-                            query = query.filter(getattr(self.model, field) == value)
-            
-            return query.count()
-    
-    def create(self, obj_data: Dict[str, Any]) -> ModelType:
+        with self._session_scope(session) as session:
+            # SELECT count(*) FROM table, rather than counting over a subquery of every column
+            query = session.query(func.count()).select_from(self.model)
+            query = self._apply_filters(query, filters)
+            return query.scalar()
+    
+    def create(self, obj_data: Dict[str, Any], session: Optional[Session] = None) -> ModelType:
         """Create a new record."""
-        print(obj_data)
-        with get_db_context() as session:
+        with self._session_scope(session) as session:
             db_obj = self.model(**obj_data)
             session.add(db_obj)
             session.commit()
             session.refresh(db_obj)
             return db_obj
     
-    def update(self, id: Any, obj_data: Dict[str, Any]) -> Optional[ModelType]:
+    def update(self, id: Any, obj_data: Dict[str, Any], session: Optional[Session] = None) -> Optional[ModelType]:
         """Update an existing record."""
-        with get_db_context() as session:
+        with self._session_scope(session) as session:
             db_obj = session.query(self.model).filter(getattr(self.model, "id") == id).first()
             if db_obj:
                 for field, value in obj_data.items():
@@ -89,9 +182,25 @@ class BaseRepository(Generic[ModelType], ABC):
                 return db_obj
             return None
     
-    def delete(self, id: Any) -> bool:
+    def update_fields(self, id: Any, values: Dict[str, Any], session: Optional[Session] = None) -> int:
+        """Update columns of a record with a single UPDATE statement.
+        
+        Unlike update, the row is neither loaded nor refreshed, and instances
+        already in the session are left as they are. Returns the number of rows matched.
+        """
+        with self._session_scope(session) as session:
+            result = session.execute(
+                update(self.model)
+                .where(getattr(self.model, "id") == id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            return result.rowcount
+    
+    def delete(self, id: Any, session: Optional[Session] = None) -> bool:
         """Delete a record by ID."""
-        with get_db_context() as session:
+        with self._session_scope(session) as session:
             db_obj = session.query(self.model).filter(getattr((self.model),"id") == id).first()
             if db_obj:
                 session.delete(db_obj)
@@ -99,39 +208,76 @@ class BaseRepository(Generic[ModelType], ABC):
                 return True
             return False
     
-    def bulk_create(self, objects_data: List[Dict[str, Any]]) -> List[ModelType]:
+    def bulk_create(self, objects_data: List[Dict[str, Any]], session: Optional[Session] = None) -> List[ModelType]:
         """Create multiple records in a single transaction."""
-        with get_db_context() as session:
-            db_objects = [self.model(obj_data) for obj_data in objects_data]
-            session.add_all(db_objects)
+        if not objects_data:
+            return []
+        with self._session_scope(session) as session:
+            if session.get_bind().dialect.insert_executemany_returning:
+                # One executemany-style INSERT ... RETURNING instead of per-object
+                # flushes followed by a refresh SELECT for each row; rows come
+                # back in the order of objects_data
+                db_objects = list(session.scalars(
+                    insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                    objects_data,
+                ))
+            else:
+                # No RETURNING for executemany (e.g. MySQL): insert with one
+                # flush, then load server defaults with a single keyed SELECT
+                db_objects = [self.model(**obj_data) for obj_data in objects_data]
+                session.add_all(db_objects)
+                session.flush()
+                id_column = getattr(self.model, "id")
+                session.scalars(
+                    select(self.model)
+                    .where(id_column.in_([obj.id for obj in db_objects]))
+                    .execution_options(populate_existing=True)
+                ).all()
             session.commit()
-            for obj in db_objects:
-                session.refresh(obj)
             return db_objects
     
-    def exists(self, id: Any) -> bool:
+    def exists(self, id: Any, session: Optional[Session] = None) -> bool:
         """Check if a record exists by ID."""
-        with get_db_context() as session:
-            return session.query(self.model).filter(getattr(self.model, "id") == id).first() is not None
-    
-    def get_by_field(self, field_name: str, field_value: Any) -> Optional[ModelType]:
-        """Get a record by a specific field."""
-        with get_db_context() as session:
-            if hasattr(self.model, field_name):
-                return session.query(self.model).filter(
-                    getattr(self.model, field_name) == field_value
+        with self._session_scope(session) as session:
+            return session.query(
+                session.query(self.model).filter(getattr(self.model, "id") == id).exists()
+            ).scalar()
+    
+    def get_by_field(
+        self,
+        field_name: str,
+        field_value: Any,
+        columns: Optional[List[str]] = None,
+        session: Optional[Session] = None
+    ) -> Optional[ModelType]:
+        """Get a record by a specific field, optionally loading only some columns."""
+        with self._session_scope(session) as session:
+            column = self._columns.get(field_name)
+            if column is None:
+                return None
+            if columns:
+                return self._project(session.query(self.model), columns).filter(
+                    column == field_value
                 ).first()
-            return None
+            return session.scalars(self._lookup_statement(field_name), {"value": field_value}).first()
     
     def get_multiple_by_field(
         self, 
         field_name: str, 
-        field_values: List[Any]
+        field_values: List[Any],
+        session: Optional[Session] = None
     ) -> List[ModelType]:
-        """Get multiple records by field values."""
-        with get_db_context() as session:
-            if hasattr(self.model, field_name):
-                return session.query(self.model).filter(
-                    getattr(self.model, field_name).in_(field_values)
-                ).all()
-            return []
\ No newline at end of file
+        """Get multiple records by field values.
+        
+        Prefer this over calling get_by_field in a loop: values are fetched
+        with IN queries of at most IN_CHUNK_SIZE values each.
+        """
+        with self._session_scope(session) as session:
+            column = self._columns.get(field_name)
+            if column is None:
+                return []
+            results: List[ModelType] = []
+            for start in range(0, len(field_values), IN_CHUNK_SIZE):
+                chunk = field_values[start:start + IN_CHUNK_SIZE]
+                results.extend(session.query(self.model).filter(column.in_(chunk)).all())
+            return results
\ No newline at end of file
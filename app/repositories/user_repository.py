@@ -1,30 +1,158 @@
 from app.repositories.base_repository import BaseRepository
 from app.models.user import User, UserStatus
-from app.config.database import get_db_context
-from typing import List, Optional
-from sqlalchemy import or_
+from app.config.settings import settings
+from app.utils.ttl_cache import TTLCache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Set, Tuple
+from sqlalchemy import event, or_, select
+from sqlalchemy.orm import Session
+
+# to_response() dicts of recently looked-up users, keyed by (field, value).
+# Only hits are cached, so a newly created user is never hidden behind a
+# cached miss. Plain dicts rather than ORM instances, so nothing read from
+# the cache can be written back through a session.
+_lookup_cache: TTLCache[Dict[str, Any]] = TTLCache(
+    maxsize=settings.user_cache_max_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+
+# session.info flag set when a flush changed or deleted a user
+_USERS_CHANGED = "users_changed"
+
+def _invalidate_on_flush(session: Session, flush_context) -> None:
+    """Clear the lookup cache when any session flushes a User change.
+    
+    Clearing again after commit closes the window in which another thread
+    could re-cache the row as it was before this transaction committed.
+    """
+    if any(isinstance(obj, User) for obj in chain(session.dirty, session.deleted)):
+        _lookup_cache.clear()
+        session.info[_USERS_CHANGED] = True
+
+def _invalidate_on_commit(session: Session) -> None:
+    if session.info.pop(_USERS_CHANGED, False):
+        _lookup_cache.clear()
+
+event.listen(Session, "after_flush", _invalidate_on_flush)
+event.listen(Session, "after_commit", _invalidate_on_commit)
 
 class UserRepository(BaseRepository[User]):
     def __init__(self):
         super().__init__(User)
     
-    def get_by_email(self, email: str) -> Optional[User]:
-        return self.get_by_field("email", email)
+    def get_by_email(self, email: str, session: Optional[Session] = None) -> Optional[User]:
+        return self.get_by_field("email", email, session=session)
+    
+    def get_by_username(self, username: str, session: Optional[Session] = None) -> Optional[User]:
+        return self.get_by_field("username", username, session=session)
+    
+    def _cached_lookup(self, field_name: str, field_value: Any, session: Optional[Session]) -> Optional[Dict[str, Any]]:
+        """to_response() dict of the user matching field_name, served from the lookup cache.
+        
+        A caller-provided session bypasses the cache, so reads inside a unit of
+        work always see that session's state. Every hit is returned as a copy.
+        """
+        if session is not None:
+            user = self.get_by_field(field_name, field_value, session=session)
+            return user.to_response() if user is not None else None
+        key = (field_name, field_value)
+        data = _lookup_cache.get(key)
+        if data is None:
+            user = self.get_by_field(field_name, field_value)
+            if user is None:
+                return None
+            data = user.to_response()
+            _lookup_cache.set(key, data)
+        return dict(data)
+    
+    def get_cached_by_id(self, id: Any, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        return self._cached_lookup("id", id, session)
+    
+    def get_cached_by_email(self, email: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        return self._cached_lookup("email", email, session)
+    
+    def get_cached_by_username(self, username: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        return self._cached_lookup("username", username, session)
+    
+    def update_fields(self, id: Any, values: Dict[str, Any], session: Optional[Session] = None) -> int:
+        # A Core UPDATE doesn't flush ORM objects, so invalidate explicitly
+        updated = super().update_fields(id, values, session=session)
+        _lookup_cache.clear()
+        if session is not None:
+            session.info[_USERS_CHANGED] = True
+        return updated
+    
+    def find_conflict(
+        self,
+        email: str,
+        username: Optional[str] = None,
+        session: Optional[Session] = None
+    ) -> Optional[str]:
+        """Return "email" or "username" if either is already taken, else None.
+        
+        Both are checked with a single query; an email clash is reported first.
+        """
+        with self._session_scope(session) as session:
+            condition = User.email == email
+            if username:
+                condition = or_(condition, User.username == username)
+            rows = session.execute(
+                select(User.email, User.username).where(condition).limit(2)
+            ).all()
+        if any(row.email == email for row in rows):
+            return "email"
+        return "username" if rows else None
+    
+    def find_taken(
+        self,
+        emails: List[str],
+        usernames: List[str],
+        session: Optional[Session] = None
+    ) -> Tuple[Set[str], Set[str]]:
+        """Return which of the given emails and usernames already exist, using one query."""
+        if not emails and not usernames:
+            return set(), set()
+        with self._session_scope(session) as session:
+            rows = session.execute(
+                select(User.email, User.username).where(
+                    or_(User.email.in_(emails), User.username.in_(usernames))
+                )
+            ).all()
+        wanted_emails, wanted_usernames = set(emails), set(usernames)
+        return (
+            {row.email for row in rows if row.email in wanted_emails},
+            {row.username for row in rows if row.username in wanted_usernames},
+        )
     
-    def get_by_username(self, username: str) -> Optional[User]:
-        return self.get_by_field("username", username)
+    def get_many_by_ids(self, ids: List[str], session: Optional[Session] = None) -> List[User]:
+        return self.get_multiple_by_field("id", ids, session=session)
     
-    def get_active_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    def get_active_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[List[str]] = None,
+        session: Optional[Session] = None
+    ) -> List[User]:
         return self.get_all(
             skip=skip, 
             limit=limit, 
-            filters={"status": UserStatus.ACTIVE}
+            filters={"status": UserStatus.ACTIVE},
+            columns=columns,
+            session=session
         )
     
-    def search_users(self, search_term: str, limit: int = 50) -> List[User]:
-        with get_db_context() as session:
+    def search_users(
+        self,
+        search_term: str,
+        limit: int = 50,
+        columns: Optional[List[str]] = None,
+        session: Optional[Session] = None
+    ) -> List[User]:
+        """Search users by name, email or username, optionally loading only some columns."""
+        with self._session_scope(session) as session:
             search_pattern = f"%{search_term}%"
-            return session.query(User).filter(
+            return self._project(session.query(User), columns).filter(
                 or_(
                     User.first_name.ilike(search_pattern),
                     User.last_name.ilike(search_pattern),
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, status
-from app.schemas.users import UserCreate, UserResponse
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.orm import Session
+from app.config.database import get_db
+from app.schemas.user import UserCreate, UserResponse
 from app.controllers.user_controller import user_controller
 
 auth_router = APIRouter(
@@ -8,12 +10,24 @@ auth_router = APIRouter(
 )
 
 @auth_router.post("/",
-    response_model=UserResponse,
+    # The service returns a ready UserResponse, so FastAPI is told not to
+    # validate it again; the schema is still documented through responses
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": UserResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Create a new user",
     description="Create a new user account with the provided information.")
-async def create_user(user_data: UserCreate):
-    return await user_controller.create_user(user_data)
+def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
+    # Sync handler: FastAPI runs it in the threadpool, so the blocking
+    # database and bcrypt work stays off the event loop
+    user = user_controller.create_user(user_data, session=db)
+    # Encode with pydantic-core's JSON serializer directly rather than
+    # walking the model through jsonable_encoder first
+    return Response(
+        content=user.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 @auth_router.get("/login")
 async def login():
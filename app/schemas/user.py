@@ -1,8 +1,18 @@
-from enum import Enum
-from pydantic import EmailStr, Field, BaseModel, field_validator, model_validator
+# app/schemas/user.py
+from pydantic import EmailStr, Field, BaseModel, ConfigDict, model_validator
 from typing import Optional
 from datetime import datetime
-from app.schemas.validators import UserValidators
+from app.schemas.validators import (
+    Email,
+    LoginEmail,
+    LoginUsername,
+    Name,
+    Password,
+    PhoneNumber,
+    StrongPassword,
+    Url,
+    Username,
+)
 from app.models.user import UserRole, Gender, UserStatus
 
 class UserBase(BaseModel):
@@ -10,49 +20,36 @@ class UserBase(BaseModel):
         None,
         description="Unique identifier for a user"
     )
-    email: EmailStr = Field(
+    email: Email = Field(
         ..., 
         description="User's email address"
     )
-    username: Optional[str] = Field(
+    username: Optional[Username] = Field(
         None,
-        min_length=3,
-        max_length=50,
-        pattern="^[a-zA-Z0-9_]+$",
         description="Username (alphanumeric and underscore only)",
     )
-    password: str = Field(
+    password: StrongPassword = Field(
         ...,
-        min_length = 8,
-        max_length = 32,
         description="User's password"
     )
-    first_name: str = Field(
+    first_name: Name = Field(
         ...,
-        min_length=1,
-        max_length=100,
         description="First Name"
     )
-    last_name: str = Field(
+    last_name: Name = Field(
         ...,
-        min_length=1,
-        max_length=100,
         description="Last Name"
     )
-    display_name: Optional[str] = Field(
+    display_name: Optional[Name] = Field(
         None,
-        min_length=1,
-        max_length=100,
         description="Last Name"
     )
-    avatar_url: Optional[str] = Field(
+    avatar_url: Optional[Url] = Field(
         None,
-        max_length=500,
         description="URL to profile picture"
     )
-    phone_number: Optional[str] = Field(
+    phone_number: Optional[PhoneNumber] = Field(
         None,
-        pattern=r"^[\+]?[1-9][\d]{0,15}$",
         description="Phone number in international format"
     )
     date_of_birth: Optional[datetime] = Field(
@@ -75,73 +72,24 @@ class UserBase(BaseModel):
         UserStatus.PENDING_VERIFICATION,
         description="Account status"
     )
-    
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, v):
-        return UserValidators.validate_email(v)
-
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v):
-        return UserValidators.validate_password(v, require_special_char=True)
-    
-    @field_validator("first_name", "last_name", "display_name")
-    @classmethod
-    def validate_names(cls, v):
-        return UserValidators.validate_name(v)
-    
-    @field_validator("username")
-    @classmethod
-    def validate_username(cls, v):
-        return UserValidators.validate_username(v)
-    
-    @field_validator("avatar_url")
-    @classmethod
-    def validate_avatar_url(cls, v):
-        return UserValidators.validate_url(v, max_length=500)
-    
-    @field_validator("phone_number")
-    @classmethod
-    def validate_phone_number(cls, v):
-        return UserValidators.validate_phone_number(v)
 
 class UserCreate(UserBase):
     pass
 
 class UserLogin(BaseModel):
-    email: Optional[EmailStr] = Field(
+    email: Optional[LoginEmail] = Field(
         None,
         description="Email address of the user"
     )
-    username: Optional[str] = Field(
+    username: Optional[LoginUsername] = Field(
         None,
-        min_length=3,
-        max_length=50,
         description="Username (alphanumeric and underscore only)",
     )
-    password: str = Field(
+    password: StrongPassword = Field(
         ...,
-        min_length=8,
-        max_length=32,
         description="Password for the user"
     )
 
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, v):
-        return UserValidators.validate_email(v)
-
-    @field_validator("username")
-    @classmethod
-    def validate_username(cls, v):
-        return UserValidators.validate_username(v)
-
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v):
-        return UserValidators.validate_password(v, require_special_char=True)
-
     # Checking for whether both username and email are empty. If empty then send error response
     @model_validator(mode='before')
     @classmethod
@@ -157,6 +105,9 @@ class UserLogin(BaseModel):
         return data
 
 class UserResponse(BaseModel):
+    # Read-only output built from trusted rows, so it is never mutated
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(
         ...,
         description="Unique identifier for a user"
@@ -221,4 +172,50 @@ class UserResponse(BaseModel):
         ...,
         description="Timestamp when the user was last updated"
     )
-    
\ No newline at end of file
+
+
+# Schema for updating user information
+class UserUpdate(BaseModel):
+    """Schema for updating user information."""
+
+    email: Optional[Email] = Field(None, description="New email address")
+    username: Optional[Username] = Field(None, description="New username")
+    first_name: Optional[Name] = Field(None, description="New first name")
+    last_name: Optional[Name] = Field(None, description="New last name")
+    password: Optional[Password] = Field(None, description="New password")
+    phone_number: Optional[PhoneNumber] = Field(None, description="New phone number")
+    bio: Optional[str] = Field(None, max_length=1000, description="New biography")
+    profile_picture_url: Optional[Url] = Field(None, description="New profile picture URL")
+    is_active: Optional[bool] = Field(None, description="Account active status")
+    is_verified: Optional[bool] = Field(None, description="Email verification status")
+    role: Optional[UserRole] = Field(None, description="User role")
+
+
+# Schema for user summary (minimal user information)
+class UserSummary(BaseModel):
+    """Schema for minimal user information."""
+
+    id: int = Field(..., description="User ID")
+    email: str = Field(..., description="User's email address")
+    username: Optional[str] = Field(None, description="Username")
+    full_name: str = Field(..., description="Full name")
+    role: UserRole = Field(..., description="User role")
+    is_active: bool = Field(..., description="Whether the account is active")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Schema for password reset request
+class PasswordResetRequest(BaseModel):
+    """Schema for password reset request."""
+
+    email: Email = Field(..., description="User's email address")
+
+
+# Schema for password reset confirmation
+class PasswordResetConfirm(BaseModel):
+    """Schema for password reset confirmation."""
+
+    token: str = Field(..., description="Reset token")
+    new_password: Password = Field(..., description="New password")
+
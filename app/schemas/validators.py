@@ -1,5 +1,15 @@
-from typing import Optional
+from functools import partial
+from typing import Annotated, Final, Optional
+from pydantic import AfterValidator, EmailStr, StringConstraints
 import re
+from urllib.parse import urlsplit
+
+# Shared patterns, compiled once and reused by the schema field constraints
+USERNAME_RE: Final = re.compile(r"^[a-zA-Z0-9_]+$")
+PHONE_NUMBER_RE: Final = re.compile(r"^\+?[1-9]\d{0,15}$")
+_URL_SCHEMES: Final = frozenset({"http", "https"})
+_PHONE_SEPARATORS_RE: Final = re.compile(r'[\s\-]')
+_SPECIAL_CHARS: Final = frozenset('!@#$%^&*()-_=+[]{}|;:,.<>?/')
 
 
 class UserValidators:
@@ -9,6 +19,15 @@ class UserValidators:
             return email
         return email.lower().strip()
     
+    @staticmethod
+    def validate_login_email(email: Optional[str]) -> Optional[str]:
+        # Logins only look up an existing account, so a normalised string with
+        # an "@" is enough; the full address parse happens at sign-up
+        email = UserValidators.validate_email(email)
+        if email is not None and "@" not in email:
+            raise ValueError('Invalid email address')
+        return email
+    
     @staticmethod
     def validate_name(name: Optional[str]) -> Optional[str]:
         if name is None:
@@ -40,23 +59,31 @@ class UserValidators:
         if len(password) < 8:
             raise ValueError('Password must be at least 8 characters long')
         
-        # Check for at least one uppercase letter
-        if not any(c.isupper() for c in password):
-            raise ValueError('Password must contain at least one uppercase letter')
+        # Classify every character in a single pass, stopping once all
+        # required character classes have been seen
+        has_upper = has_lower = has_digit = False
+        has_special = not require_special_char
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            if c in _SPECIAL_CHARS:
+                has_special = True
+            if has_upper and has_lower and has_digit and has_special:
+                break
         
-        # Check for at least one lowercase letter
-        if not any(c.islower() for c in password):
+        if not has_upper:
+            raise ValueError('Password must contain at least one uppercase letter')
+        if not has_lower:
             raise ValueError('Password must contain at least one lowercase letter')
-        
-        # Check for at least one digit
-        if not any(c.isdigit() for c in password):
+        if not has_digit:
             raise ValueError('Password must contain at least one digit')
-        
-        # Check for special character (only if required)
-        if require_special_char:
-            special_chars = '!@#$%^&*()-_=+[]{}|;:,.<>?/'
-            if not any(c in special_chars for c in password):
-                raise ValueError('Password must contain at least one special character')
+        # Special character is only checked when required
+        if not has_special:
+            raise ValueError('Password must contain at least one special character')
         
         return password
     
@@ -66,10 +93,10 @@ class UserValidators:
             return phone
             
         # Remove all spaces and hyphens for validation
-        clean_phone = re.sub(r'[\s\-]', '', phone)
+        clean_phone = _PHONE_SEPARATORS_RE.sub('', phone)
         
         # Check if it matches the pattern
-        if not re.match(r"^\+?[1-9]\d{0,15}$", clean_phone):
+        if not PHONE_NUMBER_RE.match(clean_phone):
             raise ValueError('Invalid phone number format')
             
         return phone
@@ -86,16 +113,67 @@ class UserValidators:
         if len(url) > max_length:
             raise ValueError(f'URL must be less than {max_length} characters')
             
-        # Basic URL validation
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-            
-        if not url_pattern.match(url):
+        # Basic URL validation: an http(s) URL with a host, a valid port if
+        # one is given, and no embedded whitespace
+        parts = urlsplit(url)
+        try:
+            parts.port
+        except ValueError:
+            raise ValueError('Invalid URL format')
+        if (
+            parts.scheme.lower() not in _URL_SCHEMES
+            or not parts.hostname
+            or any(c.isspace() for c in url)
+        ):
             raise ValueError('Invalid URL format')
             
-        return url
\ No newline at end of file
+        return url
+
+
+# Field types carrying their length/pattern constraints plus the matching
+# UserValidators normalisation, which runs once after the constraints pass,
+# instead of a forwarding @field_validator per model
+Email = Annotated[EmailStr, AfterValidator(UserValidators.validate_email)]
+LoginEmail = Annotated[
+    str,
+    StringConstraints(max_length=254),
+    AfterValidator(UserValidators.validate_login_email),
+]
+Name = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=100),
+    AfterValidator(UserValidators.validate_name),
+]
+Username = Annotated[
+    str,
+    StringConstraints(min_length=3, max_length=50, pattern=USERNAME_RE.pattern),
+    AfterValidator(UserValidators.validate_username),
+]
+# Login only checks the length, like the login form always has, so existing
+# usernames outside the sign-up pattern can still log in
+LoginUsername = Annotated[
+    str,
+    StringConstraints(min_length=3, max_length=50),
+    AfterValidator(UserValidators.validate_username),
+]
+PhoneNumber = Annotated[
+    str,
+    StringConstraints(pattern=PHONE_NUMBER_RE.pattern),
+    AfterValidator(UserValidators.validate_phone_number),
+]
+Url = Annotated[
+    str,
+    StringConstraints(max_length=500),
+    AfterValidator(partial(UserValidators.validate_url, max_length=500)),
+]
+# Passwords set at sign-up/login require a special character; updates and resets do not
+StrongPassword = Annotated[
+    str,
+    StringConstraints(min_length=8, max_length=32),
+    AfterValidator(partial(UserValidators.validate_password, require_special_char=True)),
+]
+Password = Annotated[
+    str,
+    StringConstraints(min_length=8, max_length=128),
+    AfterValidator(partial(UserValidators.validate_password, require_special_char=False)),
+]
@@ -1,15 +1,22 @@
 # app/services/user_service.py
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 from passlib.context import CryptContext
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from app.repositories.user_repository import user_repository
 from app.models.user import User
+from app.config.settings import settings
 import logging
-from app.schemas.users import UserCreate, UserResponse
+from app.schemas.user import UserCreate, UserResponse
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"])
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=settings.password_bcrypt_rounds)
+
+# bcrypt releases the GIL, so batch hashing scales with the available cores
+_HASH_WORKERS = os.cpu_count() or 1
 
 class UserService:    
     def __init__(self):
@@ -21,34 +28,75 @@ class UserService:
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
     
-    def create_user(self, user_data: UserCreate) -> UserResponse:
+    def create_user(self, user_data: UserCreate, session: Optional[Session] = None) -> UserResponse:
         try:
-            # Check if user already exists
-            existing_user = self.user_repo.get_by_email(user_data.email)
-            print(existing_user)
-            if existing_user:
+            # Check email and username uniqueness in one query
+            conflict = self.user_repo.find_conflict(user_data.email, user_data.username, session=session)
+            if conflict == "email":
                 raise ValueError(f"User with email {user_data.email} already exists")
+            if conflict == "username":
+                raise ValueError(f"Username {user_data.username} is already taken")
             
-            # Check username uniqueness if provided
-            if user_data.username:
-                existing_username = self.user_repo.get_by_username(user_data.username)
-                if existing_username:
-                    raise ValueError(f"Username {user_data.username} is already taken")
-            
-            # Prepare user data
+            # Prepare user data. Hashing is deliberately the last step before
+            # the insert, so rejected signups never pay for bcrypt
             user_dict = user_data.model_dump()
             user_dict["password"] = self._hash_password(user_data.password)
             
-            # Create user
-            user = self.user_repo.create(user_dict)
+            # Create user; the unique indexes still catch a concurrent signup
+            # that slipped in between the check above and this insert
+            try:
+                user = self.user_repo.create(user_dict, session=session)
+            except IntegrityError:
+                raise ValueError("User with this email or username already exists")
             
-            logger.info(f"User created successfully: {user.email}")
-            return UserResponse.model_validate(user.to_response())
+            logger.info("User created successfully: %s", user.email)
+            # Row data straight from the database is already valid, so build the
+            # response without re-running the schema validators
+            return UserResponse.model_construct(**user.to_response())
             # return UserResponse.model_validate(user.to_dict())
             
         except Exception as e:
-            print(e)
-            logger.error(f"Failed to create user: {str(e)}")
+            logger.error("Failed to create user: %s", e)
+            raise
+
+    
+    def create_users(self, batch: List[UserCreate], session: Optional[Session] = None) -> List[UserResponse]:
+        """Create several users with one uniqueness query and one INSERT.
+        
+        Intended for bulk imports and seeding: passwords are hashed in
+        parallel threads and the batch is rejected as a whole on any conflict.
+        """
+        if not batch:
+            return []
+        try:
+            emails = [user_data.email for user_data in batch]
+            usernames = [user_data.username for user_data in batch if user_data.username]
+            if len(set(emails)) != len(emails) or len(set(usernames)) != len(usernames):
+                raise ValueError("Batch contains duplicate emails or usernames")
+            
+            taken_emails, taken_usernames = self.user_repo.find_taken(emails, usernames, session=session)
+            if taken_emails:
+                raise ValueError(f"Users with emails {', '.join(sorted(taken_emails))} already exist")
+            if taken_usernames:
+                raise ValueError(f"Usernames {', '.join(sorted(taken_usernames))} are already taken")
+            
+            with ThreadPoolExecutor(max_workers=min(len(batch), _HASH_WORKERS)) as pool:
+                hashes = pool.map(self._hash_password, (user_data.password for user_data in batch))
+                users_data = [
+                    {**user_data.model_dump(), "password": password_hash}
+                    for user_data, password_hash in zip(batch, hashes)
+                ]
+            
+            try:
+                users = self.user_repo.bulk_create(users_data, session=session)
+            except IntegrityError:
+                raise ValueError("Some of these emails or usernames already exist")
+            
+            logger.info("Created %d users", len(users))
+            return [UserResponse.model_construct(**user.to_response()) for user in users]
+            
+        except Exception as e:
+            logger.error("Failed to create users: %s", e)
             raise
 
 
@@ -1,6 +1,9 @@
+import atexit
+import queue
 import sys
-import json
+import threading
 import time
+import orjson
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
@@ -11,6 +14,88 @@ from typing import Union, Callable
 # Context variables for request tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
+_get_request_id = request_id_var.get
+_get_user_id = user_id_var.get
+
+def _add_request_context(record) -> None:
+    """Patcher copying the request context into the record's extra.
+
+    The context variables are read once per record here, and every sink
+    then gets request_id and user_id from extra, including the serialized
+    JSON sinks, which never call CustomFormatter.
+    """
+    request_id = _get_request_id()
+    if request_id:
+        record["extra"]["request_id"] = request_id
+    user_id = _get_user_id()
+    if user_id:
+        record["extra"]["user_id"] = user_id
+
+# Size suffixes in rotation settings and their loguru spelling
+_SIZE_SUFFIXES = (("MB", " MB"), ("GB", " GB"))
+
+# Log directories already created by this process
+_created_log_dirs: set = set()
+
+def _ensure_parent_dir(log_file: Union[str, Path]) -> None:
+    """Create the directory of a log file once per process"""
+    parent = Path(log_file).parent
+    if parent not in _created_log_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _created_log_dirs.add(parent)
+
+class ThreadedSink:
+    """Stream sink that writes from a background thread.
+
+    loguru's enqueue=True pickles every record onto a multiprocessing queue,
+    which buys nothing in a single-process server. This hands the already
+    formatted message to a thread through an in-process queue instead.
+    
+    Logging never blocks the caller: when the stream stalls and the queue is
+    full, messages are dropped and counted, and the writer reports the count
+    once it catches up.
+    """
+    
+    def __init__(self, stream, maxsize: int = 10_000):
+        self._stream = stream
+        # Bounded so a stalled stream can't grow memory without limit
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=maxsize)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def write(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+    
+    def stop(self) -> None:
+        """Write out everything queued so far and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+    
+    def _drain(self) -> None:
+        get = self._queue.get
+        while True:
+            message = get()
+            if message is None:
+                break
+            try:
+                self._stream.write(message)
+                if self._dropped:
+                    with self._dropped_lock:
+                        dropped, self._dropped = self._dropped, 0
+                    self._stream.write(f"{dropped} log messages dropped: log output queue was full\n")
+                # Flush once the queue is empty rather than after every line
+                if self._queue.empty():
+                    self._stream.flush()
+            except Exception as e:
+                sys.stderr.write(f"Error writing log message: {e}\n")
 
 class CustomFormatter:
     """Custom formatter for structured logging"""
@@ -18,52 +103,78 @@ class CustomFormatter:
     def __init__(self, settings, include_extra: bool = True):
         self.settings = settings
         self.include_extra = include_extra
+        # Key order of every record, with the per-process fields filled in
+        # once; format() copies this and assigns the per-record values
+        self._base_log_data = {
+            "timestamp": None,
+            "level": None,
+            "logger": None,
+            "message": None,
+            "module": None,
+            "function": None,
+            "line": None,
+            "process_id": None,
+            "thread_id": None,
+            "environment": settings.environment,
+            "app_name": settings.app_name,
+            "app_version": settings.app_version,
+        }
+        self._reserved_keys = frozenset(self._base_log_data) | {"exception"}
     
     def format(self, record)->str:
         """Format log record with additional context"""
-        # Get context variables
-        request_id = request_id_var.get()
-        user_id = user_id_var.get()
+        exception = record["exception"]
+        extra = record["extra"]
         
         # Base log data
-        log_data = {
-            "timestamp": record["time"].isoformat(),
-            "level": record["level"].name,
-            "logger": record["name"],
-            "message": record["message"],
-            "module": record["module"],
-            "function": record["function"],
-            "line": record["line"],
-            "process_id": record["process"].id,
-            "thread_id": record["thread"].id,
-            "environment": self.settings.environment,
-            "app_name": self.settings.app_name,
-            "app_version": self.settings.app_version,
-        }
+        log_data = self._base_log_data.copy()
+        log_data["timestamp"] = record["time"].isoformat()
+        log_data["level"] = record["level"].name
+        log_data["logger"] = record["name"]
+        log_data["message"] = record["message"]
+        log_data["module"] = record["module"]
+        log_data["function"] = record["function"]
+        log_data["line"] = record["line"]
+        log_data["process_id"] = record["process"].id
+        log_data["thread_id"] = record["thread"].id
         
         # Add context if available
+        request_id = extra.get("request_id")
         if request_id:
             log_data["request_id"] = request_id
+        user_id = extra.get("user_id")
         if user_id:
             log_data["user_id"] = user_id
             
         # Add exception info if present
-        if record["exception"]:
+        if exception:
             log_data["exception"] = {
-                "type": record["exception"].type.__name__,
-                "value": str(record["exception"].value),
-                "traceback": traceback.format_exception(
-                    record["exception"].type,
-                    record["exception"].value,
-                    record["exception"].traceback
+                "type": exception.type.__name__,
+                "value": str(exception.value),
+                # One string, as traceback.format_exc() gives in the request
+                # logs, rather than a list of per-frame strings
+                "traceback": "".join(
+                    traceback.TracebackException(
+                        exception.type, exception.value, exception.traceback
+                    ).format()
                 )
             }
         
-        # Add extra fields
-        if self.include_extra and record["extra"]:
-            log_data["extra"] = record["extra"]
-            
-        return json.dumps(log_data, ensure_ascii=False)
+        # Add extra fields at the top level; ones clashing with a base field
+        # keep their value under an "ex_" prefix
+        if self.include_extra and extra:
+            if self._reserved_keys.isdisjoint(extra):
+                log_data.update(extra)
+            else:
+                for key, value in extra.items():
+                    if key in self._reserved_keys:
+                        key = f"ex_{key}"
+                    log_data[key] = value
+        
+        # orjson encodes in C and emits UTF-8 directly (the ensure_ascii=False
+        # behaviour); values it cannot encode natively fall back to str(), and
+        # non-string keys in extra are stringified as json.dumps did
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 class LoggerConfig:
     """Production-grade logger configuration"""
@@ -77,29 +188,32 @@ class LoggerConfig:
         # Remove default logger
         logger.remove()
         
-        # Setup console logging
+        # Snapshot the request context onto each record as it is logged
+        logger.configure(patcher=_add_request_context)
+        
+        # Setup console logging. The console sink queues to its own writer
+        # thread; file sinks keep enqueue=True as loguru's rotation and
+        # compression run inside its file sink
         if self.settings.log_console:
             if self.settings.log_json:
                 # For JSON console output, use serialize=True and no color
                 logger.add(
-                    sys.stdout,
+                    ThreadedSink(sys.stdout),
                     level=self.settings.log_level,
                     backtrace=self.settings.log_backtrace,
                     diagnose=self.settings.debug,
-                    enqueue=True,  # Thread-safe logging
                     catch=True,    # Catch exceptions in logging
                     serialize=True,  # JSON format
                 )
             else:
                 console_format = self._get_console_format()
                 logger.add(
-                    sys.stdout,
+                    ThreadedSink(sys.stdout),
                     format=console_format,
                     level=self.settings.log_level,
                     colorize=self.settings.log_color,
                     backtrace=self.settings.log_backtrace,
                     diagnose=self.settings.debug,
-                    enqueue=True,  # Thread-safe logging
                     catch=True,    # Catch exceptions in logging
                 )
         
@@ -131,8 +245,7 @@ class LoggerConfig:
     def _setup_file_logging(self):
         """Setup file logging with rotation"""
         # Ensure log directory exists
-        log_path = Path(self.settings.log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(self.settings.log_file)
         
         if self.settings.log_json:
             # For JSON logging, we'll use serialize=True instead of custom formatter
@@ -166,10 +279,13 @@ class LoggerConfig:
             )
     
     def _setup_exception_logging(self):
-        """Setup separate exception logging"""
+        """Setup separate exception logging.
+        
+        The sink's level already drops records below log_exception_level,
+        so no per-record filter is needed on top of it.
+        """
         # Ensure exception log directory exists
-        exception_path = Path(self.settings.log_exception_file)
-        exception_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(self.settings.log_exception_file)
         
         if self.settings.log_exception_json:
             # For JSON logging, use serialize=True
@@ -184,7 +300,6 @@ class LoggerConfig:
                 enqueue=True,
                 catch=True,
                 serialize=True,  # JSON format
-                filter=lambda record: record["level"].no >= logger.level(self.settings.log_exception_level).no
             )
         else:
             # Use loguru's format string syntax for exceptions with more detail
@@ -201,20 +316,18 @@ class LoggerConfig:
                 enqueue=True,
                 catch=True,
                 serialize=False,
-                filter=lambda record: record["level"].no >= logger.level(self.settings.log_exception_level).no
             )
     
     def _setup_request_logger(self):
         """Setup separate request logger"""
         request_log_file = "logs/requests.log"
-        Path(request_log_file).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(request_log_file)
         
         # Fixed filter function - loguru wraps extra data in another 'extra' key
-        def request_filter(record):
-            extra = record.get("extra", {})
-            # Loguru wraps the extra data in another "extra" key
-            actual_extra = extra.get("extra", {})
-            return "request" in actual_extra
+        def request_filter(record, _empty={}):
+            # record["extra"] is always present; the nested "extra" is only
+            # there when the call passed extra=...
+            return "request" in record["extra"].get("extra", _empty)
         
         if self.settings.log_json:
             # For JSON logging, use serialize=True
@@ -247,23 +360,35 @@ class LoggerConfig:
     
     def _parse_rotation(self, rotation: str):
         """Parse rotation string to loguru format"""
-        if rotation.endswith(" day") or rotation.endswith(" days"):
-            return rotation
-        elif rotation.endswith("MB"):
-            return f"{rotation.replace('MB', '')} MB"
-        elif rotation.endswith("GB"):
-            return f"{rotation.replace('GB', '')} GB"
+        # "10MB" -> "10 MB"; day-based and other values pass through unchanged
+        for suffix, replacement in _SIZE_SUFFIXES:
+            if rotation.endswith(suffix):
+                return rotation[:-len(suffix)] + replacement
         return rotation
     
     def _parse_retention(self, retention: str):
         """Parse retention string to loguru format"""
-        if retention.endswith(" day") or retention.endswith(" days"):
-            return retention
+        # loguru already understands every retention format we accept
         return retention
 
+# Logging method for each security event severity
+_SEVERITY_LOG_FUNCS: Dict[str, Callable] = {
+    "trace": logger.trace,
+    "debug": logger.debug,
+    "info": logger.info,
+    "success": logger.success,
+    "warning": logger.warning,
+    "error": logger.error,
+    "critical": logger.critical,
+}
+
 # Logger utilities
 class LoggerUtils:
-    """Utility functions for logging"""
+    """Utility functions for logging.
+    
+    Messages are passed to loguru as templates plus arguments, so they are
+    only formatted when some sink accepts the level.
+    """
     
     @staticmethod
     def set_request_context(request_id: str, user_id: Optional[str] = None):
@@ -282,7 +407,7 @@ class LoggerUtils:
     def log_performance(operation: str, duration: float, **kwargs):
         """Log performance metrics"""
         logger.info(
-            f"Performance: {operation} completed in {duration:.4f}s",
+            "Performance: {} completed in {:.4f}s", operation, duration,
             extra={
                 "performance": True,
                 "operation": operation,
@@ -295,7 +420,7 @@ class LoggerUtils:
     def log_business_event(event: str, **kwargs):
         """Log business events"""
         logger.info(
-            f"Business Event: {event}",
+            "Business Event: {}", event,
             extra={
                 "business_event": True,
                 "event": event,
@@ -306,9 +431,9 @@ class LoggerUtils:
     @staticmethod
     def log_security_event(event: str, severity: str = "INFO", **kwargs):
         """Log security events"""
-        log_func = getattr(logger, severity.lower(), logger.info)
+        log_func = _SEVERITY_LOG_FUNCS.get(severity.lower(), logger.info)
         log_func(
-            f"Security Event: {event}",
+            "Security Event: {}", event,
             extra={
                 "security_event": True,
                 "event": event,
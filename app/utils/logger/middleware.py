@@ -1,113 +1,148 @@
+import itertools
+import os
 import time
 import traceback
-import uuid
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
 from loguru import logger
 from .logger_config import LoggerUtils
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for comprehensive request/response logging"""
+# Request IDs are correlation IDs, not secrets: a per-process prefix (start
+# time and pid, so restarts and workers don't collide) plus a counter
+_REQUEST_ID_PREFIX = f"{time.time_ns():x}-{os.getpid():x}-"
+_request_counter = itertools.count(1)
+
+def _next_request_id() -> str:
+    return f"{_REQUEST_ID_PREFIX}{next(_request_counter):x}"
+
+# Headers carrying the client IP behind proxies, in order of preference
+_CLIENT_IP_HEADERS = (
+    "x-forwarded-for",
+    "x-real-ip",
+    "x-client-ip",
+    "cf-connecting-ip",  # Cloudflare
+    "true-client-ip",    # Akamai
+)
+
+class LoggingMiddleware:
+    """Middleware for comprehensive request/response logging.
+    
+    A plain ASGI middleware: BaseHTTPMiddleware runs every request through
+    an extra task and memory streams, which is costly on this hot path.
+    """
     
     def __init__(self, app, settings):
-        super().__init__(app)
+        self.app = app
         self.settings = settings
         self.excluded_paths = ["/health", "/metrics", "/favicon.ico"]
-        self.sensitive_headers = ["authorization", "cookie", "x-api-key"]
+        self.slow_threshold = 1.0  # seconds
+        self.slow_warning_threshold = 2.0  # seconds
+        self.very_slow_threshold = 5.0  # seconds
+        self.sensitive_headers = frozenset({"authorization", "cookie", "x-api-key"})
+        # Request headers included in the log, sensitive ones redacted.
+        # Names are lowercase, matching how Starlette stores header keys
+        self.logged_headers = (
+            "host", "user-agent", "content-type", "content-length", "accept",
+            "accept-encoding", "accept-language", "referer", "origin",
+            "x-forwarded-for", "x-real-ip", "x-request-id",
+            "authorization", "cookie", "x-api-key",
+        )
+        # Request bodies of these content types are never logged
+        self.binary_content_types = ("multipart/", "application/octet-stream")
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        request = Request(scope)
+        headers = request.headers
+        url = request.url
+        path = url.path
+        
         # Skip logging for excluded paths
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
+        if path in self.excluded_paths:
+            return await self.app(scope, receive, send)
         
-        request_id = str(uuid.uuid4())
+        request_id = _next_request_id()
         LoggerUtils.set_request_context(request_id)
         
         # Capture request body for POST/PUT requests
         request_body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if body:
-                    # Don't log sensitive data
-                    if "password" not in str(body).lower():
-                        request_body = body.decode("utf-8")[:1000]  # Limit size
-            except:
-                pass
+        if (
+            request.method in ["POST", "PUT", "PATCH"]
+            and not headers.get("content-type", "").startswith(self.binary_content_types)
+        ):
+            body, receive = await self._read_body(receive)
+            # Only the start of the body is ever logged or checked
+            head = body[:2048].lower()
+            # Don't log sensitive data
+            if head and b"password" not in head and b"passwd" not in head:
+                request_body = body[:1000].decode("utf-8", errors="replace")  # Limit size
         
-        # Log request with rich context
-        logger.info("Request received", extra={
+        # Request fields are logged together with the response in a single
+        # record once the request finishes
+        request_log = {
             "request": True,
             "request_id": request_id,
             "method": request.method,
-            "url": str(request.url),
-            "path": request.url.path,
+            "url": str(url),
+            "path": path,
             "query_params": dict(request.query_params),
-            "headers": self._filter_sensitive_headers(dict(request.headers)),
+            "headers": self._filter_sensitive_headers(headers),
             "client_ip": self._get_client_ip(request),
-            "user_agent": request.headers.get("user-agent", ""),
-            "content_type": request.headers.get("content-type", ""),
-            "content_length": request.headers.get("content-length", 0),
+            "user_agent": headers.get("user-agent", ""),
+            "content_type": headers.get("content-type", ""),
+            "content_length": headers.get("content-length", 0),
             "request_body": request_body,
-            "referer": request.headers.get("referer"),
-            "accept": request.headers.get("accept"),
-            "accept_encoding": request.headers.get("accept-encoding"),
-            "accept_language": request.headers.get("accept-language")
-        })
+            "referer": headers.get("referer"),
+            "accept": headers.get("accept"),
+            "accept_encoding": headers.get("accept-encoding"),
+            "accept_language": headers.get("accept-language")
+        }
+        
+        start_time = time.perf_counter()
+        response_start = {}
         
-        start_time = time.time()
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Add performance headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Response-Time"] = f"{(time.perf_counter() - start_time)*1000:.2f}ms"
+                response_start["status_code"] = message["status"]
+                response_start["headers"] = headers
+            await send(message)
         
         # Process request
         try:
-            response = await call_next(request)
-            duration = time.time() - start_time
+            await self.app(scope, receive, send_wrapper)
+            duration = time.perf_counter() - start_time
             
             # Capture response details
-            response_headers = dict(response.headers)
+            response_headers = response_start.get("headers") or MutableHeaders()
             
-            # Log response
+            # Log request and response
             logger.info("Request completed", extra={
-                "request": True,
+                **request_log,
                 "response": True,
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
+                "status_code": response_start.get("status_code"),
                 "duration": duration,
-                "response_headers": response_headers,
-                "content_type": response.headers.get("content-type", ""),
-                "content_length": response.headers.get("content-length", 0),
-                "cache_control": response.headers.get("cache-control"),
+                "response_headers": dict(response_headers),
+                "response_content_type": response_headers.get("content-type", ""),
+                "response_content_length": response_headers.get("content-length", 0),
+                "cache_control": response_headers.get("cache-control"),
                 "server_timing": f"total;dur={duration*1000:.2f}"
             })
             
-            # Add performance headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{duration*1000:.2f}ms"
-            
             # Log performance warnings
-            if duration > 2.0:
-                logger.warning("Slow request detected", extra={
-                    "performance": True,
-                    "slow_request": True,
-                    "request_id": request_id,
-                    "path": request.url.path,
-                    "duration": duration,
-                    "threshold_exceeded": "2s"
-                })
-            
-            return response
+            self._log_slow_request(request, request_id, duration)
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             logger.error("Request failed", extra={
-                "request": True,
+                **request_log,
                 "error": True,
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
                 "duration": duration,
                 "error_type": type(e).__name__,
                 "error_message": str(e),
@@ -119,75 +154,89 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         finally:
             LoggerUtils.clear_request_context()
     
-    def _filter_sensitive_headers(self, headers: dict) -> dict:
-        """Filter out sensitive headers"""
+    @staticmethod
+    async def _read_body(receive):
+        """Read the whole request body, returning it with a receive that replays it"""
+        messages = []
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        
+        async def replay():
+            if messages:
+                return messages.pop(0)
+            return await receive()
+        
+        return b"".join(chunks), replay
+    
+    def _filter_sensitive_headers(self, headers) -> dict:
+        """Pick the logged headers, filtering out sensitive ones"""
         filtered = {}
-        for key, value in headers.items():
-            if key.lower() in self.sensitive_headers:
+        for key in self.logged_headers:
+            value = headers.get(key)
+            if value is None:
+                continue
+            if key in self.sensitive_headers:
                 filtered[key] = "[REDACTED]"
             else:
                 filtered[key] = value
         return filtered
     
-    def _get_client_ip(self, request: Request) -> str:
-        """Get real client IP"""
-        # Check various headers in order of preference
-        ip_headers = [
-            "X-Forwarded-For",
-            "X-Real-IP",
-            "X-Client-IP",
-            "CF-Connecting-IP",  # Cloudflare
-            "True-Client-IP"     # Akamai
-        ]
-        
-        for header in ip_headers:
-            if header in request.headers:
-                ip = request.headers[header].split(",")[0].strip()
-                if ip:
-                    return ip
-        
-        return request.client.host if request.client else "unknown"
-    
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    """Middleware for performance monitoring"""
-    
-    def __init__(self, app, settings):
-        super().__init__(app)
-        self.settings = settings
-        self.slow_threshold = 1.0  # seconds
-        self.very_slow_threshold = 5.0  # seconds
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
-        response = await call_next(request)
-        
-        duration = time.time() - start_time
-        
-        # Log performance metrics
+    def _log_slow_request(self, request: Request, request_id: str, duration: float):
+        """Log requests slower than the performance thresholds"""
         if duration > self.very_slow_threshold:
             logger.warning(
                 f"Very slow request: {request.method} {request.url.path}",
                 extra={
                     "performance": True,
                     "very_slow": True,
+                    "request_id": request_id,
                     "method": request.method,
                     "path": request.url.path,
                     "duration": duration,
                     "threshold": self.very_slow_threshold,
                 }
             )
+        elif duration > self.slow_warning_threshold:
+            logger.warning("Slow request detected", extra={
+                "performance": True,
+                "slow_request": True,
+                "request_id": request_id,
+                "path": request.url.path,
+                "duration": duration,
+                "threshold_exceeded": "2s"
+            })
         elif duration > self.slow_threshold:
             logger.info(
                 f"Slow request: {request.method} {request.url.path}",
                 extra={
                     "performance": True,
                     "slow": True,
+                    "request_id": request_id,
                     "method": request.method,
                     "path": request.url.path,
                     "duration": duration,
                     "threshold": self.slow_threshold,
                 }
             )
+    
+    def _get_client_ip(self, request: Request) -> str:
+        """Get real client IP"""
+        # Check various headers in order of preference
+        headers = request.headers
+        for header in _CLIENT_IP_HEADERS:
+            value = headers.get(header)
+            if value:
+                # First address of a comma-separated list
+                comma = value.find(",")
+                ip = (value[:comma] if comma != -1 else value).strip()
+                if ip:
+                    return ip
         
-        return response
\ No newline at end of file
+        return request.client.host if request.client else "unknown"
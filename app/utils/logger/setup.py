@@ -1,6 +1,7 @@
+import time
 from loguru import logger
 from .logger_config import LoggerConfig
-from .middleware import LoggingMiddleware, PerformanceMiddleware
+from .middleware import LoggingMiddleware
 
 def setup_logging(settings):
     """Setup production logging configuration"""
@@ -23,8 +24,8 @@ def setup_logging(settings):
 
 def add_logging_middleware(app, settings):
     """Add logging middleware to FastAPI app"""
+    # LoggingMiddleware also reports slow requests, so one layer covers both
     app.add_middleware(LoggingMiddleware, settings=settings)
-    app.add_middleware(PerformanceMiddleware, settings=settings)
 
 # Context manager for performance logging
 class LogPerformance:
@@ -36,12 +37,12 @@ class LogPerformance:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         logger.debug(f"Starting operation: {self.operation}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - (self.start_time or time.time())
+        duration = time.perf_counter() - (self.start_time or time.perf_counter())
         
         if exc_type:
             logger.error(
@@ -65,5 +66,3 @@ class LogPerformance:
                     **self.kwargs
                 }
             )
-
-import time
\ No newline at end of file
@@ -1,9 +1,65 @@
+import asyncio
+import logging
 import os
 from app.config.database import logger
 from pathlib import Path
 import shutil
 
 
+def _scandir_size(path: str) -> int:
+    """Total size of the files under path, using the sizes os.scandir already read"""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _scandir_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _cleanup_pycache_sync(project_root: Path) -> None:
+    """Blocking body of cleanup_pycache, run in a worker thread"""
+    logger.info(f"Starting __pycache__ cleanup in development mode: {project_root}")
+    
+    # Sizes are only needed for the debug summary, so skip stat-ing every
+    # cached file unless debug logging is on
+    measure_size = logger.isEnabledFor(logging.DEBUG)
+    deleted_count = 0
+    total_size = 0
+    
+    # Walk through all directories and find __pycache__ folders
+    for root, dirs, files in os.walk(project_root):
+        if '__pycache__' in dirs:
+            pycache_path = os.path.join(root, '__pycache__')
+            
+            try:
+                if measure_size:
+                    total_size += _scandir_size(pycache_path)
+                
+                # Remove the __pycache__ directory
+                shutil.rmtree(pycache_path)
+                deleted_count += 1
+                
+                if measure_size:
+                    logger.debug(f"Deleted __pycache__ folder: {pycache_path}")
+                
+            except PermissionError as e:
+                logger.warning(f"Permission denied deleting {pycache_path}: {e}")
+            except Exception as e:
+                logger.error(f"Error deleting {pycache_path}: {e}")
+            
+            # Remove from dirs list to prevent os.walk from descending into it
+            dirs.remove('__pycache__')
+    
+    if deleted_count > 0:
+        logger.info(f"__pycache__ cleanup completed: {deleted_count} folders deleted")
+        if measure_size:
+            logger.debug(f"__pycache__ cleanup freed {total_size / (1024 * 1024):.2f} MB")
+    else:
+        logger.info("No __pycache__ folders found to clean up")
+
+
 async def cleanup_pycache():
     """
     Remove all __pycache__ directories recursively from the project root.
@@ -14,45 +70,8 @@ async def cleanup_pycache():
         current_file = Path(__file__)
         project_root = current_file.parent.parent.parent
         
-        logger.info(f"Starting __pycache__ cleanup in development mode: {project_root}")
-        
-        deleted_count = 0
-        total_size = 0
-        
-        # Walk through all directories and find __pycache__ folders
-        for root, dirs, files in os.walk(project_root):
-            if '__pycache__' in dirs:
-                pycache_path = Path(root) / '__pycache__'
-                
-                try:
-                    # Calculate size before deletion
-                    folder_size = sum(
-                        f.stat().st_size for f in pycache_path.rglob('*') if f.is_file()
-                    )
-                    total_size += folder_size
-                    
-                    # Remove the __pycache__ directory
-                    shutil.rmtree(pycache_path)
-                    deleted_count += 1
-                    
-                    logger.debug(f"Deleted __pycache__ folder: {pycache_path}")
-                    
-                except PermissionError as e:
-                    logger.warning(f"Permission denied deleting {pycache_path}: {e}")
-                except Exception as e:
-                    logger.error(f"Error deleting {pycache_path}: {e}")
-                
-                # Remove from dirs list to prevent os.walk from descending into it
-                dirs.remove('__pycache__')
-        
-        if deleted_count > 0:
-            size_mb = total_size / (1024 * 1024)
-            logger.info(
-                f"__pycache__ cleanup completed: {deleted_count} folders deleted, "
-                f"{size_mb:.2f} MB freed"
-            )
-        else:
-            logger.info("No __pycache__ folders found to clean up")
+        # Directory walking and deletion block, so keep them off the event loop
+        await asyncio.to_thread(_cleanup_pycache_sync, project_root)
             
     except Exception as e:
-        logger.error(f"Error during __pycache__ cleanup: {e}")
\ No newline at end of file
+        logger.error(f"Error during __pycache__ cleanup: {e}")